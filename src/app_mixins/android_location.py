@@ -2,6 +2,9 @@ from kivy.clock import Clock
 from kivy.utils import platform as kivy_platform
 
 try:
+    # pyjnius bootstraps a JVM on import; skip that work off-device.
+    if kivy_platform != "android":
+        raise ImportError("pyjnius is only used on Android")
     from jnius import autoclass, PythonJavaClass, java_method
 except Exception:  # pragma: no cover - desktop/test environments
     autoclass = None
@@ -1,4 +1,5 @@
 import time
+from functools import partial
 
 from kivy.clock import Clock
 
@@ -15,7 +16,48 @@ class WeatherSyncMixin:
     
     # Flag to track if current weather data was loaded from cache
     _weather_from_cache = False
+    # Clock event driving the periodic weather refresh
+    _weather_refresh_event = None
+    # Incremented per fetch; results of superseded fetches are dropped
+    _weather_request_id = 0
     
+    def _start_weather_refresh_timer(self):
+        """Schedule periodic weather refreshes for the current coordinates.
+        
+        Uses a Kivy Clock interval of WEATHER_REFRESH_INTERVAL seconds so the
+        network cadence no longer depends on how often GPS updates arrive.
+        Calling it again while the timer is active has no effect.
+        """
+        if self._weather_refresh_event is not None:
+            return
+        self._weather_refresh_event = Clock.schedule_interval(
+            self._on_weather_refresh_tick, self.WEATHER_REFRESH_INTERVAL
+        )
+
+    def _on_weather_refresh_tick(self, _dt):
+        """Refresh weather data for the last applied coordinates.
+        
+        Clock callback scheduled by _start_weather_refresh_timer(). Does
+        nothing until a location has been applied. The coordinates are
+        unchanged, so the location cache on disk is not rewritten.
+        """
+        if self.current_lat is None or self.current_lon is None:
+            return
+        self._apply_location(
+            self.current_lat,
+            self.current_lon,
+            force_refresh=True,
+            track_as_gps=self._has_live_gps_fix,
+            save_location=False,
+        )
+
+    def _stop_weather_refresh_timer(self):
+        """Cancel the periodic weather refresh started by _start_weather_refresh_timer()."""
+        if self._weather_refresh_event is None:
+            return
+        self._weather_refresh_event.cancel()
+        self._weather_refresh_event = None
+
     def _should_refresh_weather(self) -> bool:
         """Check if enough time has elapsed to refresh weather data.
         
@@ -37,19 +79,23 @@ class WeatherSyncMixin:
         lon: float,
         force_refresh: bool = False,
         track_as_gps: bool = False,
+        save_location: bool = True,
     ):
         """Apply location coordinates and fetch weather data.
         
         Stores the provided coordinates, optionally saves them to cache,
-        and fetches weather data from the API. Updates all weather UI
-        screens with the fetched data. Falls back to cached data if the
-        API call fails.
+        and fetches weather data from the API on a background thread so the
+        UI stays responsive. The result is applied on the Kivy main thread
+        by _on_weather_loaded() / _on_weather_error(); the service falls
+        back to cached data if the API call fails.
         
         Args:
             lat (float): Latitude coordinate (-90 to 90)
             lon (float): Longitude coordinate (-180 to 180)
             force_refresh (bool): Force API refresh even if interval throttle active
             track_as_gps (bool): Mark as live GPS fix and save to location cache
+            save_location (bool): Write a live GPS fix to the location cache;
+                False for refreshes of coordinates that are already stored
         """
         source = "live GPS" if track_as_gps else "fallback/cached location"
         print(
@@ -58,37 +104,100 @@ class WeatherSyncMixin:
         )
         self.current_lat = lat
         self.current_lon = lon
-        if track_as_gps:
+        if track_as_gps and save_location:
             self._save_last_known_location(lat, lon)
 
-        if not force_refresh and not self._should_refresh_weather():
+        if force_refresh:
+            self._last_weather_refresh_ts = time.monotonic()
+        elif not self._should_refresh_weather():
             print(
                 "Skipping weather refresh due to interval throttle "
                 f"({self.WEATHER_REFRESH_INTERVAL}s)."
             )
             return
 
+        self._weather_request_id += 1
+        request_id = self._weather_request_id
+
+        def on_done(data):
+            Clock.schedule_once(
+                partial(
+                    self._on_weather_loaded,
+                    request_id,
+                    lat,
+                    lon,
+                    track_as_gps,
+                    data,
+                    save_location=save_location,
+                )
+            )
+
+        def on_error(error):
+            Clock.schedule_once(
+                partial(self._on_weather_error, request_id, track_as_gps, error)
+            )
+
+        weather_service.get_weather_threaded(on_done, on_error, lat=lat, lon=lon)
+
+    def _on_weather_loaded(
+        self,
+        request_id: int,
+        lat: float,
+        lon: float,
+        track_as_gps: bool,
+        data: dict,
+        _dt=None,
+        save_location: bool = True,
+    ):
+        """Apply a fetched weather payload to the UI (main thread).
+        
+        Args:
+            request_id (int): Fetch id assigned by _apply_location()
+            lat (float): Latitude the data was requested for
+            lon (float): Longitude the data was requested for
+            track_as_gps (bool): Whether the coordinates are a live GPS fix
+            data (dict): Weather API response
+            _dt: Clock delta time (unused)
+            save_location (bool): Store the resolved label with a live GPS fix
+        """
+        if request_id != self._weather_request_id:
+            print(f"Dropping stale weather result (request {request_id}).")
+            return
+
         try:
-            data = weather_service.get_weather(lat=lat, lon=lon)
             # Check if data came from cache
             self._weather_from_cache = data.get("__cached__", False)
             self._log_location_roundtrip(lat, lon, data)
-            #print(json.dumps(data, indent=2))
             location_label = self._update_location_labels_from_weather(
                 data,
                 track_as_gps=track_as_gps,
             )
-            if track_as_gps:
+            if track_as_gps and save_location:
                 self._save_last_known_location(lat, lon, label=location_label)
             self._update_weather_display(data)
             self._refresh_forecast_screen()
         except Exception as e:
-            print("Error fetching weather with coordinates:", e)
-            self._weather_from_cache = True  # Mark as using fallback cache
-            if self.last_location_label:
-                self._set_location_labels(self.last_location_label)
-            else:
-                self._set_location_labels(self._location_label_from_error(e, track_as_gps))
+            self._on_weather_error(request_id, track_as_gps, e)
+
+    def _on_weather_error(self, request_id: int, track_as_gps: bool, error: Exception, _dt=None):
+        """Show a fallback location label after a failed fetch (main thread).
+        
+        Args:
+            request_id (int): Fetch id assigned by _apply_location()
+            track_as_gps (bool): Whether the coordinates are a live GPS fix
+            error (Exception): Error raised while fetching or applying data
+            _dt: Clock delta time (unused)
+        """
+        if request_id != self._weather_request_id:
+            print(f"Dropping stale weather error (request {request_id}).")
+            return
+
+        print("Error fetching weather with coordinates:", error)
+        self._weather_from_cache = True  # Mark as using fallback cache
+        if self.last_location_label:
+            self._set_location_labels(self.last_location_label)
+        else:
+            self._set_location_labels(self._location_label_from_error(error, track_as_gps))
 
     def _log_location_roundtrip(
         self,
@@ -257,7 +366,7 @@ class WeatherSyncMixin:
 
         screen = sm.get_screen("five_days")
         if hasattr(screen, "_load_forecast_data"):
-            Clock.schedule_once(lambda _dt: screen._load_forecast_data(), 0)
+            Clock.schedule_once(screen._load_forecast_data, 0)
 
     def _update_weather_display(self, weather_data):        
         """Update all weather screens with current and forecast data.
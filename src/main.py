@@ -1,11 +1,9 @@
 from pathlib import Path
-import json
 
 from kivy.app import App
 from kivy.resources import resource_add_path
 from kivy.utils import platform as kivy_platform
 
-import services.weather_service as weather_service
 from app_mixins.android_location import AndroidLocationMixin
 from app_mixins.location_cache import LocationCacheMixin
 from app_mixins.weather_sync import WeatherSyncMixin
@@ -48,11 +46,13 @@ class WeatherApp(AndroidLocationMixin, LocationCacheMixin, WeatherSyncMixin, App
     def on_start(self):
         """Initialize the application on startup.
         
-        Loads the last cached location and initiates the location flow.
+        Loads the last cached location, starts the periodic weather refresh
+        and initiates the location flow.
         On Android devices, starts the GPS permission request and location tracking.
         On other platforms, uses fallback coordinates (London).
         """
         self._load_last_known_location()
+        self._start_weather_refresh_timer()
 
         if kivy_platform == "android":
             self._start_android_location_flow()
@@ -66,6 +66,24 @@ class WeatherApp(AndroidLocationMixin, LocationCacheMixin, WeatherSyncMixin, App
             "platform without Android GPS support"
         )
 
+    def on_pause(self):
+        """Stop the periodic weather refresh while the app is in the background.
+        
+        Returns:
+            bool: True so Android keeps the app alive and can resume it
+        """
+        self._stop_weather_refresh_timer()
+        return True
+
+    def on_resume(self):
+        """Restart the periodic weather refresh when the app returns to the foreground."""
+        self._start_weather_refresh_timer()
+
+    def on_stop(self):
+        """Cancel the periodic weather refresh and release GPS resources."""
+        self._stop_weather_refresh_timer()
+        super().on_stop()
+
     def navigate(self, key: str):
         """Navigate to a different screen in the application.
         
@@ -79,14 +97,4 @@ class WeatherApp(AndroidLocationMixin, LocationCacheMixin, WeatherSyncMixin, App
 
 
 if __name__ == "__main__":
-    # Print current weather JSON once when running as a script, then start the app.
-    def print_weather_json():
-        """Call the weather service and print the returned JSON."""
-        try:
-            data = weather_service.get_weather()
-            print(json.dumps(data, indent=2))
-        except Exception as e:
-            print("Error fetching weather:", e)
-
-    print_weather_json()
     WeatherApp().run()
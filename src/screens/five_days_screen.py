@@ -12,9 +12,13 @@ Classes:
 
 Constants:
     ROW_HEIGHT: Fixed height of each forecast row in dp (density-independent pixels)
+    RV_FIXED_SPACING: Total spacing between the card's children
+    CARD_VERTICAL_PADDING: Top + bottom padding of the weather card
+    MIN_RV_HEIGHT: Lower bound for the RecycleView height
 """
 
 from datetime import datetime
+from functools import partial
 from kivy.metrics import dp
 from kivy.properties import ListProperty
 from kivy.clock import Clock
@@ -25,6 +29,9 @@ import services.weather_service as weather_service
 
 ROW_HEIGHT = dp(66)
 VISIBLE_FORECAST_DAYS = 5
+RV_FIXED_SPACING = dp(10 * 4)
+CARD_VERTICAL_PADDING = dp(44)
+MIN_RV_HEIGHT = dp(140)
 
 
 class FiveDaysScreen(BaseWeatherScreen):
@@ -50,6 +57,8 @@ class FiveDaysScreen(BaseWeatherScreen):
     """
     
     forecast_items = ListProperty([])
+    # Incremented per fetch; results of superseded fetches are dropped
+    _forecast_request_id = 0
 
     def on_kv_post(self, base_widget):
         """
@@ -66,51 +75,94 @@ class FiveDaysScreen(BaseWeatherScreen):
         Clock.schedule_once(self._bind_layout_updates, 0)
         
         # Load forecast data from API
-        Clock.schedule_once(lambda dt: self._load_forecast_data(), 0)
+        Clock.schedule_once(self._load_forecast_data, 0)
 
     def _bind_layout_updates(self, _dt):
         """Bind size-dependent updates after KV ids are available."""
         if "card" in self.ids:
-            self.ids.card.bind(size=lambda *_: self._update_rv_height())
+            self.ids.card.bind(size=self._update_rv_height)
         if "nav" in self.ids:
-            self.ids.nav.bind(size=lambda *_: self._update_rv_height())
+            self.ids.nav.bind(size=self._update_rv_height)
         if "frog_slot" in self.ids:
-            self.ids.frog_slot.bind(size=lambda *_: self._update_rv_height())
+            self.ids.frog_slot.bind(size=self._update_rv_height)
 
         self._update_rv_height()
 
-    def _load_forecast_data(self):
+    def _load_forecast_data(self, _dt=None):
         """
-        Fetch and process 5-day forecast data from the weather API.
+        Fetch 5-day forecast data from the weather API in the background.
         
-        Makes an API call to get forecast data, processes it into daily summaries
-        with min/max temperatures and time-of-day breakdowns, then updates the
-        forecast_items list.
+        Starts the request on a worker thread via weather_service.get_weather_threaded()
+        so the UI stays responsive; the result is handed back to the Kivy main thread
+        with Clock.schedule_once and applied by _on_forecast_loaded() or
+        _on_forecast_error().
         
-        Falls back to hardcoded data if API call fails.
+        Falls back to hardcoded data if the API call fails.
+        
+        Args:
+            _dt: Clock delta time when scheduled via Clock.schedule_once (unused)
+        """
+        # Get current GPS coordinates from the app instance
+        app = App.get_running_app()
+        if app is None:
+            print("Error loading forecast data: no running app")
+            self._load_fallback_data()
+            Clock.schedule_once(self._update_rv_height, 0)
+            return
+        lat = app.current_lat
+        lon = app.current_lon
+
+        self._forecast_request_id += 1
+        request_id = self._forecast_request_id
+
+        def on_done(data):
+            Clock.schedule_once(partial(self._on_forecast_loaded, request_id, data))
+
+        def on_error(error):
+            Clock.schedule_once(partial(self._on_forecast_error, request_id, error))
+
+        weather_service.get_weather_threaded(on_done, on_error, lat=lat, lon=lon)
+
+    def _on_forecast_loaded(self, request_id, data, _dt=None):
+        """
+        Process a fetched forecast payload into forecast_items (main thread).
+        
+        Args:
+            request_id: Fetch id assigned by _load_forecast_data()
+            data: Weather API response
+            _dt: Clock delta time (unused)
         """
+        if request_id != self._forecast_request_id:
+            return
+
         try:
-            # Get current GPS coordinates from the app instance
-            app = App.get_running_app()
-            lat = app.current_lat
-            lon = app.current_lon
-            
-            # Call the weather API forecast endpoint with GPS coordinates
-            data = weather_service.get_weather(lat=lat, lon=lon)
-            
-            # Process the forecast data
             self.forecast_items = self._process_forecast_data(data)
-            
-        except Exception as e:
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
+            # Malformed payload (missing keys, unexpected types or dates)
             print(f"Error loading forecast data: {e}")
-            # Fallback to hardcoded data on error
             self._load_fallback_data()
+
+        Clock.schedule_once(self._update_rv_height, 0)
+
+    def _on_forecast_error(self, request_id, error, _dt=None):
+        """
+        Show fallback forecast rows after a failed fetch (main thread).
         
-        Clock.schedule_once(lambda dt: self._update_rv_height(), 0)
+        Args:
+            request_id: Fetch id assigned by _load_forecast_data()
+            error: Exception raised while fetching
+            _dt: Clock delta time (unused)
+        """
+        if request_id != self._forecast_request_id:
+            return
+
+        print(f"Error loading forecast data: {error}")
+        self._load_fallback_data()
+        Clock.schedule_once(self._update_rv_height, 0)
 
     def on_forecast_items(self, _instance, _value):
         """Recalculate height whenever forecast rows are replaced."""
-        Clock.schedule_once(lambda dt: self._update_rv_height(), 0)
+        Clock.schedule_once(self._update_rv_height, 0)
 
     def _process_forecast_data(self, data: dict) -> list:
         """
@@ -245,38 +297,39 @@ class FiveDaysScreen(BaseWeatherScreen):
         """
         self._update_rv_height()
 
-    def _update_rv_height(self):
+    def _update_rv_height(self, *_args):
         """
         Calculate and update the RecycleView height based on available space.
         
         Determines the optimal height for the RecycleView by:
         1. Calculating total content height (number of items × row height)
         2. Subtracting navigation and padding heights from card height
-        3. Applying minimum (140dp) and maximum constraints
+        3. Applying minimum (MIN_RV_HEIGHT) and maximum constraints
         4. Using the smaller of calculated or maximum height
         
         The RecycleView height is set to ensure all forecast items are visible
         while respecting screen space constraints.
         
+        Accepts and ignores positional arguments so it can be passed directly
+        as a Clock callback or a property binding.
+        
         Raises:
             Returns early if required widget IDs are not found in the layout.
         """
         if "rv" not in self.ids or "card" not in self.ids or "nav" not in self.ids:
             return
 
-        fixed_spacing = dp(10 * 4)
-        weather_card_vertical_padding = dp(44)
-        frog_height = self.ids.frog_slot.height if "frog_slot" in self.ids else dp(0)
+        frog_height = self.ids.frog_slot.height if "frog_slot" in self.ids else 0
 
         content_height = ROW_HEIGHT * max(len(self.forecast_items), VISIBLE_FORECAST_DAYS)
         available = (
             self.ids.card.height
-            - weather_card_vertical_padding
+            - CARD_VERTICAL_PADDING
             - self.ids.nav.height
             - frog_height
-            - fixed_spacing
+            - RV_FIXED_SPACING
         )
-        if available < dp(140):
-            available = dp(140)
+        if available < MIN_RV_HEIGHT:
+            available = MIN_RV_HEIGHT
 
         self.ids.rv.height = min(content_height, available)
\ No newline at end of file
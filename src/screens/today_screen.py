@@ -55,25 +55,30 @@ class TodayScreen(BaseWeatherScreen):
             # Show up to 8 next 3-hourly entries
             MAX_ITEMS = 8
             count = 0
+            # Resolve the KV-defined class once instead of per tile
+            hour_forecast_cls = Factory.HourForecast
             for entry in entries:
                 if count >= MAX_ITEMS:
                     break
 
                 # Extract data from the API entry
                 dt_txt = entry.get("dt_txt", "")
-                time_str = dt_txt.split()[1] if dt_txt and len(dt_txt.split()) > 1 else "00:00"
-                time_text = time_str[:5]
+                time_str = dt_txt.partition(" ")[2]
+                time_text = time_str[:5] if time_str else "00:00"
 
-                icon_code = entry.get("weather", [{}])[0].get("icon", "01d")
+                # Plain lookups avoid allocating empty fallback dicts/lists
+                weather = entry.get("weather")
+                weather0 = weather[0] if weather else None
+                icon_code = weather0.get("icon", "01d") if weather0 else "01d"
                 icon_source = f"icons/{icon_code}.png"
+                desc_text = weather0.get("main", "") if weather0 else ""
 
-                temp_k = entry.get("main", {}).get("temp")
+                main = entry.get("main")
+                temp_k = main.get("temp") if main else None
                 temp_text = f"{int(round(temp_k - 273.15))}°" if temp_k is not None else "--°"
 
-                desc_text = entry.get("weather", [{}])[0].get("main", "")
-
                 # Create HourForecast widget via Factory (UI defined in KV)
-                hour_forecast = Factory.HourForecast(
+                hour_forecast = hour_forecast_cls(
                     time_text=time_text,
                     icon_source=icon_source,
                     temp_text=temp_text,
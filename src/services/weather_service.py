@@ -8,55 +8,42 @@ The `.env` file is expected to contain `URL` and `API_KEY` variables.
 """
 
 import os
+import re
 import json
+import time
+import tempfile
+import contextlib
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
-import requests
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-
-# Import project-specific exceptions. Try relative import first (when the
-# package is imported as a package), then absolute import, and as a final
-# fallback load the module from the file system. This makes imports robust
-# when running tests or executing modules directly.
-try:
-    # Prefer package-relative import (works when `src` is a package)
-    from ..utils.exceptions import (
-        MissingAPIConfigError,
-        EnvNotFoundError,
-        NetworkError,
-        ServiceUnavailableError,
-        APITokenExpiredError,
-        APIRequestError,
-    )
-except Exception:
-    try:
-        # Try absolute import if the package root is on sys.path
-        from utils.exceptions import (
-            MissingAPIConfigError,
-            EnvNotFoundError,
-            NetworkError,
-            ServiceUnavailableError,
-            APITokenExpiredError,
-            APIRequestError,
-        )
-    except Exception:
-        # Last-resort: load exceptions.py directly from the src/utils folder
-        import importlib.util
-
-        exceptions_path = Path(__file__).resolve().parents[1] / "utils" / "exceptions.py"
-        spec = importlib.util.spec_from_file_location("weather_exceptions", str(exceptions_path))
-        exceptions_mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(exceptions_mod)
-
-        MissingAPIConfigError = exceptions_mod.MissingAPIConfigError
-        EnvNotFoundError = exceptions_mod.EnvNotFoundError
-        NetworkError = exceptions_mod.NetworkError
-        ServiceUnavailableError = exceptions_mod.ServiceUnavailableError
-        APITokenExpiredError = exceptions_mod.APITokenExpiredError
-        APIRequestError = exceptions_mod.APIRequestError
-
-
-def _default_env_paths() -> list[Path]:
-    """Return candidate .env paths for desktop and packaged Android runs."""
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse, parse_qs, quote_plus, urlencode, urlunparse
+
+# `src` is the application root (the directory of main.py on desktop and in
+# the APK; tests add it to sys.path), so the absolute import always resolves.
+from utils.exceptions import (
+    MissingAPIConfigError,
+    EnvNotFoundError,
+    NetworkError,
+    ServiceUnavailableError,
+    APITokenExpiredError,
+    APIRequestError,
+)
+
+# `requests` (with urllib3, charset_normalizer, certifi) is imported on first
+# use rather than at app start-up; see `_get_session()` and `fetch_json()`.
+if TYPE_CHECKING:
+    import requests
+
+
+@functools.cache
+def _default_env_paths() -> tuple[Path, ...]:
+    """Return candidate .env paths for desktop and packaged Android runs.
+
+    The module location and python-for-android hints are fixed for the
+    process, so the result is computed once and reused.
+    """
     module_path = Path(__file__).resolve()
     candidates: list[Path] = [
         module_path.parents[2] / ".env",  # repo-root layout (local dev/tests)
@@ -83,23 +70,33 @@ def _default_env_paths() -> list[Path]:
             continue
         seen.add(key)
         unique.append(candidate)
-    return unique
+    return tuple(unique)
+
+
+# One `KEY = value` assignment per line. Leading/trailing horizontal
+# whitespace (including a CR from CRLF files) is dropped; lines starting
+# with `#` or without `=` never match.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^\s=#][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+
+def _parse_env_text(text: str) -> dict:
+    """Parse the contents of a .env file in a single regex pass."""
+    return {m.group(1): m.group(2) for m in _ENV_LINE_RE.finditer(text)}
 
 
 def _parse_env_lines(lines) -> dict:
-    env = {}
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
-    return env
+    """Parse an iterable of .env lines (e.g. read from Android assets)."""
+    return _parse_env_text("\n".join(lines))
 
 
 def _load_dotenv_from_android_assets(asset_name: str = ".env") -> dict | None:
     """Best-effort read for .env embedded via buildozer android.add_assets."""
+    # python-for-android sets these; elsewhere importing pyjnius only costs
+    # a JVM bootstrap attempt before failing on PythonActivity.
+    if not (os.getenv("ANDROID_ARGUMENT") or os.getenv("ANDROID_PRIVATE")):
+        print("[dotenv] Not running on Android — skipping Android assets")
+        return None
+
     try:
         from jnius import autoclass
     except Exception:
@@ -172,6 +169,12 @@ def _load_dotenv_from_android_assets(asset_name: str = ".env") -> dict | None:
     return _parse_env_lines(lines)
 
 
+# Outcome of the default (path=None) .env search. The search runs at most
+# once per process; a missing .env is remembered as well.
+_DOTENV_LOADED = False
+_DOTENV_MISSING_MSG: str | None = None
+
+
 def load_dotenv(path=None):
     """Load key=value pairs from a .env file into the process environment.
 
@@ -180,11 +183,27 @@ def load_dotenv(path=None):
     ignored. Values are not interpreted (no quote stripping beyond simple
     split) — they are stored as raw strings.
 
+    The default search only runs once: later calls with `path=None` return
+    an empty dict (the values are already in `os.environ`) or re-raise
+    EnvNotFoundError. Explicit paths are always read.
+
+    Setting `WEATHERAPP_SKIP_DOTENV` to a non-empty value skips the default
+    search entirely (e.g. in CI or containers that inject the variables).
+
     Raises:
         EnvNotFoundError: if the .env file does not exist at the expected path.
 
     Returns a dict of loaded variables.
     """
+    global _DOTENV_LOADED, _DOTENV_MISSING_MSG
+    if path is None and os.environ.get("WEATHERAPP_SKIP_DOTENV"):
+        return {}
+
+    if path is None and _DOTENV_LOADED:
+        if _DOTENV_MISSING_MSG is not None:
+            raise EnvNotFoundError(_DOTENV_MISSING_MSG)
+        return {}
+
     if path is not None:
         candidates = [Path(path)]
     else:
@@ -194,35 +213,74 @@ def load_dotenv(path=None):
         if not candidate.exists():
             continue
 
-        env = {}
-        with candidate.open(encoding="utf-8") as f:
-            env = _parse_env_lines(f)
+        env = _parse_env_text(candidate.read_text(encoding="utf-8"))
 
         # Inject loaded variables into os.environ so other parts of the app can use them
         os.environ.update(env)
+        if path is None:
+            _DOTENV_LOADED = True
         return env
 
     if path is None:
         env = _load_dotenv_from_android_assets(".env")
         if env is not None:
             os.environ.update(env)
+            _DOTENV_LOADED = True
             return env
 
     searched = ", ".join(str(candidate) for candidate in candidates)
-    raise EnvNotFoundError(
-        f".env file not found. Looked in: {searched} and Android assets (.env)"
-    )
+    message = f".env file not found. Looked in: {searched} and Android assets (.env)"
+    if path is None:
+        _DOTENV_LOADED = True
+        _DOTENV_MISSING_MSG = message
+    raise EnvNotFoundError(message)
 
 # NOTE: Do not load the .env file at import time. Loading is deferred until
 # the service is actually used (via `_get_config()` / `get_weather()`), so
 # importing the module does not raise on missing files and leaves the
 # `get_weather` symbol available for callers and tests.
 
+# Resolved (URL, API_KEY) pair. API configuration does not change while the
+# app is running, so it is resolved once and reused for every request.
+_CONFIG_CACHE: tuple[str, str] | None = None
+_CONFIG_LOCK = threading.Lock()
+
+
+def _invalidate_config_cache() -> None:
+    """Forget the cached config and .env search so the next call re-resolves them."""
+    global _CONFIG_CACHE, _DOTENV_LOADED, _DOTENV_MISSING_MSG
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE = None
+        _DOTENV_LOADED = False
+        _DOTENV_MISSING_MSG = None
+    _default_env_paths.cache_clear()
+    build_request_url.cache_clear()
+
+
 def _get_config():
-    """Return (URL, API_KEY) from environment or raise MissingAPIConfigError.
+    """Return (URL, API_KEY), resolving them on first use.
 
     Configuration is validated when the service is actually used (via
-    `get_weather()`), which avoids side-effects at import time.
+    `get_weather()`), which avoids side-effects at import time. The first
+    successful result is cached for the rest of the process lifetime;
+    failures are not cached.
+
+    Raises:
+        MissingAPIConfigError: when no source provides both values.
+    """
+    global _CONFIG_CACHE
+    cached = _CONFIG_CACHE
+    if cached is not None:
+        return cached
+
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is None:
+            _CONFIG_CACHE = _resolve_config()
+        return _CONFIG_CACHE
+
+
+def _resolve_config():
+    """Return (URL, API_KEY) from environment or raise MissingAPIConfigError.
 
     Resolution order:
     1. Environment variables (URL, API_KEY)
@@ -257,31 +315,56 @@ def _get_config():
 
     raise MissingAPIConfigError("Missing URL or API_KEY in environment, .env, or config.py")
 
+@functools.lru_cache(maxsize=4)
+def _split_base_url(url: str) -> tuple[str, str, str | None, str | None]:
+    """Split a configured base URL once for `build_request_url`.
+
+    Returns `(base, query, lat, lon)`: the URL without query or fragment
+    (fragments are never sent to the server), the remaining query
+    re-encoded without `appid`/`lat`/`lon`, and the encoded `lat`/`lon`
+    from the URL (or None) to keep when the caller passes no coordinates.
+    """
+    parsed = urlparse(url)
+    qs = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+    qs.pop("appid", None)
+    url_lat = qs.pop("lat", None)
+    url_lon = qs.pop("lon", None)
+    base = urlunparse(parsed._replace(query="", fragment=""))
+    return (
+        base,
+        urlencode(qs),
+        quote_plus(url_lat) if url_lat is not None else None,
+        quote_plus(url_lon) if url_lon is not None else None,
+    )
+
+
 # TODO: Insert lat and lon parameters into the URL based on user location as soon as that feature is available.
+@functools.lru_cache(maxsize=16)
 def build_request_url(url: str, api_key: str, lat: str | float | None = None, lon: str | float | None = None) -> str:
     """Build a request URL from a base URL, ensuring `appid`, `lat`, `lon` are set.
 
-    - Parses the provided `url` and updates query parameters.
+    - Reuses the parsed form of `url` (see `_split_base_url`).
     - Ensures `appid` is set to `api_key`.
     - If `lat`/`lon` are provided, sets/overwrites them in the query.
 
-    Returns the full URL string ready for requests.get().
+    Results are memoized, so periodic refreshes for unchanged coordinates
+    reuse the same string.
+
+    Returns the full URL string ready for an HTTP GET.
     """
-    parsed = urlparse(url)
-    qs = parse_qs(parsed.query)
+    base, query, url_lat, url_lon = _split_base_url(url)
 
-    # Ensure API key param is present under 'appid'
-    qs["appid"] = [api_key]
+    parts = [query] if query else []
+    parts.append(f"appid={quote_plus(api_key)}")
 
-    # Optionally override coordinates
-    if lat is not None:
-        qs["lat"] = [str(lat)]
-    if lon is not None:
-        qs["lon"] = [str(lon)]
+    lat_value = quote_plus(str(lat)) if lat is not None else url_lat
+    if lat_value is not None:
+        parts.append(f"lat={lat_value}")
+    lon_value = quote_plus(str(lon)) if lon is not None else url_lon
+    if lon_value is not None:
+        parts.append(f"lon={lon_value}")
 
-    new_query = urlencode({k: v[0] for k, v in qs.items()})
-    new_parsed = parsed._replace(query=new_query)
-    return urlunparse(new_parsed)
+    return f"{base}?{'&'.join(parts)}"
 
 def _get_weather_cache_path() -> Path:
     """Return the path to the cached weather JSON file."""
@@ -292,15 +375,29 @@ def _get_weather_cache_path() -> Path:
 
 
 def _save_weather_cache(data: dict) -> None:
-    """Save weather data to cache file."""
+    """Save weather data to cache file.
+
+    Fetches run on worker threads, so the JSON is written to a temporary
+    file in the same directory and moved into place with `os.replace`.
+    A concurrent save can never leave a torn cache file behind.
+    """
+    tmp_path = None
     try:
         cache_file = _get_weather_cache_path()
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with cache_file.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=".last_weather-", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            # Compact separators: the cache is machine-read only
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
         print(f"[cache] Saved weather data to {cache_file}")
     except Exception as e:
         print(f"[cache] Failed to save weather cache: {e}")
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
 
 
 def _load_weather_cache() -> dict | None:
@@ -319,35 +416,115 @@ def _load_weather_cache() -> dict | None:
         return None
 
 
-def fetch_json(request_url: str, timeout: int = 10) -> dict:
+# Shared HTTP session so refreshes reuse the keep-alive connection to the
+# weather API instead of paying a new TCP/TLS handshake on every request.
+_SESSION: "requests.Session | None" = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Return the shared requests session, creating it on first use.
+
+    The session retries connection failures and 502/503/504 responses a
+    couple of times with a short backoff. Read timeouts are not retried so
+    a slow API does not multiply the wait. `raise_on_status=False` hands the
+    final 5xx response back to `fetch_json` for the usual error mapping.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+
+            retries = Retry(
+                total=2,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            # OpenWeather serves gzip; pin it so the forecast JSON stays
+            # small on the wire regardless of optional decoders installed.
+            session.headers.update(
+                {"Accept-Encoding": "gzip, deflate", "User-Agent": "WeatherApp/1.0"}
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def _raise_for_status(res) -> None:
+    """Raise the service exception matching an unsuccessful HTTP response.
+
+    Raises:
+        APITokenExpiredError: for 401 Unauthorized.
+        ServiceUnavailableError: for 5xx statuses.
+        APIRequestError: for any other status.
+    """
+    status = res.status_code
+    # Handle authentication / token errors explicitly
+    if status == 401:
+        raise APITokenExpiredError("API token invalid or expired")
+
+    # Service-side errors
+    if 500 <= status < 600:
+        raise ServiceUnavailableError(f"Weather service returned {status}")
+
+    # Any other non-OK response is treated as a generic API request error.
+    # Only a bounded prefix of the body is decoded for the message.
+    body = res.content[:512].decode("utf-8", "replace")
+    raise APIRequestError(f"API request failed: HTTP {status}: {body}")
+
+
+# Separate connect/read budgets: a stuck DNS/TLS handshake fails fast
+# without eating into the time allowed for the response itself.
+CONNECT_TIMEOUT = 3.0  # seconds
+READ_TIMEOUT = 10.0  # seconds
+
+
+def fetch_json(
+    request_url: str,
+    timeout: float | tuple[float, float] = (CONNECT_TIMEOUT, READ_TIMEOUT),
+    session=None,
+) -> dict:
     """Perform HTTP GET against `request_url` and return parsed JSON.
 
+    Args:
+        request_url: Fully built request URL (see `build_request_url`)
+        timeout: `(connect, read)` timeouts in seconds, or a single value
+            applied to both stages
+        session: Object with a requests-compatible `get()`; defaults to the
+            shared pooled session from `_get_session()`
+
     Raises:
         NetworkError: when there are network connectivity problems.
         APITokenExpiredError: when API returns 401 Unauthorized.
         ServiceUnavailableError: when API returns a 5xx status.
         APIRequestError: for other non-successful responses or invalid JSON.
     """
+    import requests
+
     try:
-        res = requests.get(url=request_url, timeout=timeout)
+        res = (session or _get_session()).get(request_url, timeout=timeout)
     except (requests.ConnectionError, requests.Timeout) as exc:
         # Connection problems (no internet, DNS failure, timeouts)
         raise NetworkError("Network error contacting weather API") from exc
 
-    # Handle authentication / token errors explicitly
-    if res.status_code == 401:
-        raise APITokenExpiredError("API token invalid or expired")
-
-    # Service-side errors
-    if 500 <= res.status_code < 600:
-        raise ServiceUnavailableError(f"Weather service returned {res.status_code}")
-
-    # Any other non-OK response is treated as a generic API request error
-    if not res.ok:
-        raise APIRequestError(f"API request failed: HTTP {res.status_code}: {res.text}")
+    # Happy path first: a single comparison for successful responses
+    # (same threshold as `Response.ok`); error mapping lives out of line.
+    if res.status_code >= 400:
+        _raise_for_status(res)
 
     try:
-        payload = res.json()
+        # Parse the raw bytes directly; skips requests' charset detection
+        # and the intermediate decoded str of `res.json()`.
+        payload = json.loads(res.content)
     except ValueError as exc:
         raise APIRequestError("Invalid JSON response from weather API") from exc
 
@@ -363,6 +540,35 @@ def fetch_json(request_url: str, timeout: int = 10) -> dict:
     _save_weather_cache(payload)
     return payload
 
+# In-memory responses keyed on (lat, lon): (time.monotonic() stamp, payload).
+# The TTL stays below the app's periodic refresh interval so the timer still
+# hits the network, while repeated calls in between are served from memory.
+# Live GPS fixes yield new coordinates on almost every update, so expired
+# entries are pruned and only the most recent few pairs are kept.
+_RESPONSE_CACHE: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_RESPONSE_CACHE_TTL = 30.0  # seconds
+_RESPONSE_CACHE_MAX = 4
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _clear_response_cache() -> None:
+    """Drop all in-memory weather responses."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
+def _store_response(key: tuple, stamp: float, data: dict) -> None:
+    """Cache a copy of `data`, dropping expired and least recent entries."""
+    with _RESPONSE_CACHE_LOCK:
+        expired = [k for k, (ts, _) in _RESPONSE_CACHE.items() if stamp - ts >= _RESPONSE_CACHE_TTL]
+        for k in expired:
+            del _RESPONSE_CACHE[k]
+        _RESPONSE_CACHE[key] = (stamp, dict(data))
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
 def get_weather(lat: str | float | None = None, lon: str | float | None = None) -> dict:
     """High-level API: return weather JSON from configured provider.
 
@@ -370,18 +576,36 @@ def get_weather(lat: str | float | None = None, lon: str | float | None = None)
     be inserted into the request URL query parameters. If omitted, the
     coordinates present in the configured base URL (or none) will be used.
 
-    If the API call fails, attempts to return cached weather data from the
-    last successful request. The response will have a '__cached__' flag set
-    to True when data comes from cache. Raises APIRequestError if both the 
-    API call and cache retrieval fail.
+    Responses are kept in memory for `_RESPONSE_CACHE_TTL` seconds per
+    coordinate pair (at most `_RESPONSE_CACHE_MAX` pairs), so repeated calls
+    skip the HTTP round trip. Every call
+    returns its own shallow copy, so callers may modify the result.
+
+    If the API call fails with a `NetworkError` or `ServiceUnavailableError`,
+    the last in-memory response for the coordinates is returned even when it
+    is older than the TTL. Otherwise (or without one), falls back to cached
+    weather data from the last successful request on disk. The response will have a '__cached__' flag set to True
+    when data comes from either cache. Raises the original error if the API
+    call and both caches fail.
     """
+    key = (lat, lon)
+    now = time.monotonic()
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is not None and now - entry[0] < _RESPONSE_CACHE_TTL:
+        return dict(entry[1])
+
     url, api_key = _get_config()
     request_url = build_request_url(url, api_key, lat=lat, lon=lon)
     
     try:
-        return fetch_json(request_url)
+        data = fetch_json(request_url)
     except Exception as e:
         print(f"[get_weather] API call failed ({type(e).__name__}): {e}")
+
+        if entry is not None and isinstance(e, (NetworkError, ServiceUnavailableError)):
+            print("[get_weather] Using last in-memory weather data")
+            return {**entry[1], "__cached__": True}
+
         print("[get_weather] Attempting to use cached weather data...")
         
         cached_data = _load_weather_cache()
@@ -393,5 +617,31 @@ def get_weather(lat: str | float | None = None, lon: str | float | None = None)
         # Re-raise the original exception if cache is not available
         raise
 
+    _store_response(key, now, data)
+    return data
+
+
+def get_weather_threaded(on_done, on_error, lat=None, lon=None) -> threading.Thread:
+    """Run `get_weather()` on a daemon thread and report the outcome.
+
+    Exactly one of the callbacks is invoked, on the worker thread:
+    `on_done(data)` with the weather dict, or `on_error(exc)` with the
+    exception raised by `get_weather()`. UI callers must hand the result
+    back to their main loop themselves (e.g. Kivy's `Clock.schedule_once`).
+
+    Returns the started thread.
+    """
+    def _worker():
+        try:
+            data = get_weather(lat=lat, lon=lon)
+        except Exception as exc:
+            on_error(exc)
+            return
+        on_done(data)
+
+    thread = threading.Thread(target=_worker, name="weather-fetch", daemon=True)
+    thread.start()
+    return thread
+
 
-__all__ = ["get_weather", "build_request_url", "fetch_json"]
\ No newline at end of file
+__all__ = ["get_weather", "get_weather_threaded", "build_request_url", "fetch_json"]
\ No newline at end of file
@@ -1,7 +1,13 @@
+from pathlib import Path
+
+from kivy.core.image import Image as CoreImage
 from kivy.properties import StringProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image
 
+# Bundled OpenWeather icon assets (src/icons)
+_ICONS_DIR = Path(__file__).resolve().parents[1] / "icons"
+
 
 class ForecastRow(BoxLayout):
     """Forecast row widget displaying daily forecast information.
@@ -53,20 +59,42 @@ class ForecastIcon(Image):
         super().__init__(**kwargs)
         self._is_applying_crop = False
 
-    def on_texture(self, *_args):
-        """Replace raw icon texture with cached cropped region."""
-        if self._is_applying_crop or not self.texture or not self.source:
-            return
+    @classmethod
+    def warm_cache(cls, icons_dir=None):
+        """Crop every known icon up front so list rows only do a cache lookup.
 
-        icon_name = self.source.replace("\\", "/").rsplit("/", 1)[-1]
-        icon_code = icon_name.split(".", 1)[0].lower()
-        bounds = self._ICON_BOUNDS.get(icon_code)
-        if not bounds:
-            return
+        Args:
+            icons_dir: Folder containing the `<code>.png` assets
+                (defaults to the bundled `src/icons`)
+        """
+        icons_dir = Path(icons_dir) if icons_dir else _ICONS_DIR
+        for icon_code in cls._ICON_BOUNDS:
+            try:
+                texture = CoreImage(str(icons_dir / f"{icon_code}.png")).texture
+            except Exception as e:
+                print(f"[icons] Could not preload {icon_code}: {e}")
+                continue
+            cls._crop_texture(texture, icon_code)
+
+    @classmethod
+    def _crop_texture(cls, texture, icon_code):
+        """Return the cached cropped region of `texture` for `icon_code`.
 
-        tex_w, tex_h = int(self.texture.size[0]), int(self.texture.size[1])
+        Creates and caches the region on first use. Returns None for unknown
+        icon codes or empty textures.
+        """
+        tex_w, tex_h = int(texture.size[0]), int(texture.size[1])
         if tex_w <= 0 or tex_h <= 0:
-            return
+            return None
+
+        cache_key = (icon_code, tex_w, tex_h)
+        cropped_texture = cls._CROPPED_TEXTURE_CACHE.get(cache_key)
+        if cropped_texture is not None:
+            return cropped_texture
+
+        bounds = cls._ICON_BOUNDS.get(icon_code)
+        if not bounds:
+            return None
 
         left, top, right, bottom = bounds
         left = max(0, min(left, tex_w - 1))
@@ -76,14 +104,20 @@ class ForecastIcon(Image):
         crop_w = right - left + 1
         crop_h = bottom - top + 1
 
-        cache_key = (icon_code, tex_w, tex_h)
-        cropped_texture = self._CROPPED_TEXTURE_CACHE.get(cache_key)
-        if cropped_texture is None:
-            y_from_bottom = tex_h - (bottom + 1)
-            cropped_texture = self.texture.get_region(left, y_from_bottom, crop_w, crop_h)
-            self._CROPPED_TEXTURE_CACHE[cache_key] = cropped_texture
+        y_from_bottom = tex_h - (bottom + 1)
+        cropped_texture = texture.get_region(left, y_from_bottom, crop_w, crop_h)
+        cls._CROPPED_TEXTURE_CACHE[cache_key] = cropped_texture
+        return cropped_texture
+
+    def on_texture(self, *_args):
+        """Replace raw icon texture with cached cropped region."""
+        if self._is_applying_crop or not self.texture or not self.source:
+            return
 
-        if self.texture is cropped_texture:
+        icon_name = self.source.replace("\\", "/").rsplit("/", 1)[-1]
+        icon_code = icon_name.split(".", 1)[0].lower()
+        cropped_texture = self._crop_texture(self.texture, icon_code)
+        if cropped_texture is None or self.texture is cropped_texture:
             return
 
         self._is_applying_crop = True
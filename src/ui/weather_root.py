@@ -1,6 +1,9 @@
+from kivy.clock import Clock
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.screenmanager import SlideTransition
 
+from ui.forecast_row import ForecastIcon
+
 
 class WeatherRoot(BoxLayout):
     """Root widget managing screen navigation and transitions.
@@ -10,16 +13,28 @@ class WeatherRoot(BoxLayout):
     keeps the navigation bar synchronized with the current screen.
     """
     
+    # Screen name -> position in the ScreenManager, cached between navigations
+    # together with the screen names it was built from
+    _screen_index = None
+    _screen_index_names = None
+
     def on_kv_post(self, base_widget):
         """Called after KV file is processed.
         
-        Initializes the root widget by navigating to the 'today' screen.
+        Schedules the forecast icon pre-crop for the next frame so it does not
+        delay the first frame, and initializes the root widget by navigating
+        to the 'today' screen.
         
         Args:
             base_widget: The root widget from the KV file
         """
+        Clock.schedule_once(self._warm_icon_cache, 0)
         self.navigate("today")
 
+    def _warm_icon_cache(self, _dt):
+        """Pre-crop the forecast icon textures (Clock callback)."""
+        ForecastIcon.warm_cache()
+
     def navigate(self, key: str):
         """Navigate to a different screen with animated transition.
         
@@ -36,19 +51,28 @@ class WeatherRoot(BoxLayout):
         if not target:
             return
 
+        if sm.current == target:
+            # Tapping the active segment toggles it off; restore its state.
+            self._sync_nav_for_current()
+            return
+
         # determine transition direction based on current and target indices
-        try:
-            names = list(sm.screen_names)
-            current_index = names.index(sm.current) if sm.current in names else 0
-            target_index = names.index(target)
-            if target_index > current_index:
-                direction = "left"
-            elif target_index < current_index:
-                direction = "right"
-            else:
-                direction = None
-        except Exception:
+        # (rebuilt whenever the manager's screens are added, removed or reordered)
+        screen_names = tuple(sm.screen_names)
+        screen_index = self._screen_index
+        if screen_index is None or screen_names != self._screen_index_names:
+            screen_index = {name: i for i, name in enumerate(screen_names)}
+            self._screen_index = screen_index
+            self._screen_index_names = screen_names
+
+        current_index = screen_index.get(sm.current, 0)
+        target_index = screen_index.get(target)
+        if target_index is None or target_index == current_index:
             direction = None
+        elif target_index > current_index:
+            direction = "left"
+        else:
+            direction = "right"
 
         if direction:
             sm.transition = SlideTransition(direction=direction, duration=0.5)
@@ -1,12 +1,65 @@
 import os
-import sys
-from pathlib import Path
+import socket
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
 
 
 os.environ.setdefault("KIVY_NO_ARGS", "1")
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = PROJECT_ROOT / "src"
 
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+@pytest.fixture(autouse=True)
+def _reset_service_caches():
+    """Give every test a fresh config, .env and response cache."""
+    import services.weather_service as weather_service
+
+    weather_service._invalidate_config_cache()
+    weather_service._clear_response_cache()
+    yield
+    weather_service._invalidate_config_cache()
+    weather_service._clear_response_cache()
+
+
+@pytest.fixture
+def inline_weather_fetch():
+    """Run background weather fetches and their Clock hand-off inline.
+
+    Yields the `get_weather_threaded` and `Clock.schedule_once` mocks as
+    ``threaded`` and ``schedule_once``.
+    """
+    import services.weather_service as weather_service
+
+    def run_inline(on_done, on_error, lat=None, lon=None):
+        try:
+            data = weather_service.get_weather(lat=lat, lon=lon)
+        except Exception as exc:
+            on_error(exc)
+            return
+        on_done(data)
+
+    with (
+        patch.object(weather_service, "get_weather_threaded", side_effect=run_inline) as threaded,
+        patch(
+            "kivy.clock.Clock.schedule_once",
+            side_effect=lambda callback, *_args: callback(0),
+        ) as schedule_once,
+    ):
+        yield SimpleNamespace(threaded=threaded, schedule_once=schedule_once)
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request, monkeypatch):
+    """Fail fast when a test reaches the network instead of a mock.
+
+    Mark a test with ``@pytest.mark.allow_network`` to opt out.
+    """
+    if request.node.get_closest_marker("allow_network"):
+        return
+
+    def _blocked(*_args, **_kwargs):
+        raise RuntimeError("Network access is disabled in tests; patch the request instead.")
+
+    monkeypatch.setattr(socket, "getaddrinfo", _blocked)
+    monkeypatch.setattr(socket.socket, "connect", _blocked)
+    monkeypatch.setattr(socket.socket, "connect_ex", _blocked)
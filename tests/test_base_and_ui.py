@@ -1,8 +1,8 @@
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from base_screen import BaseWeatherScreen
-from ui.forecast_row import ForecastRow
+from ui.forecast_row import ForecastIcon, ForecastRow
 from ui.weather_root import WeatherRoot
 
 
@@ -79,10 +79,20 @@ class TestWeatherRoot:
     def test_on_kv_post_calls_navigate_today(self):
         root, _manager = _build_root_with_manager()
 
-        with patch.object(root, "navigate") as navigate:
+        with (
+            patch.object(root, "navigate") as navigate,
+            patch.object(ForecastIcon, "warm_cache") as warm_cache,
+            patch("ui.weather_root.Clock.schedule_once") as schedule_once,
+        ):
             WeatherRoot.on_kv_post(root, None)
 
-        navigate.assert_called_once_with("today")
+            # The icon pre-crop is deferred to the next frame
+            warm_cache.assert_not_called()
+            navigate.assert_called_once_with("today")
+            schedule_once.assert_called_once_with(root._warm_icon_cache, 0)
+            root._warm_icon_cache(0)
+
+        warm_cache.assert_called_once_with()
 
     def test_navigate_ignores_unknown_key(self):
         root, manager = _build_root_with_manager()
@@ -106,6 +116,41 @@ class TestWeatherRoot:
         assert manager.transition is not None
         assert manager.transition.direction == "right"
 
+    def test_navigate_to_current_screen_only_resyncs_nav(self):
+        root, manager = _build_root_with_manager()
+        today_nav = manager.get_screen("today").ids["nav"]
+        today_nav.ids.btn_today.state = "normal"
+
+        with patch.object(root, "_sync_nav_for_current") as sync_nav:
+            root.navigate("today")
+
+        assert manager.current == "today"
+        assert manager.transition is None
+        sync_nav.assert_called_once_with()
+
+    def test_navigate_rebuilds_screen_index_when_screens_change(self):
+        root, manager = _build_root_with_manager()
+        root.navigate("tomorrow")
+        assert root._screen_index == {"today": 0, "tomorrow": 1, "five_days": 2}
+
+        manager.screen_names = ["radar", *manager.screen_names]
+        root.navigate("5days")
+
+        assert root._screen_index == {"radar": 0, "today": 1, "tomorrow": 2, "five_days": 3}
+        assert manager.current == "five_days"
+        assert manager.transition.direction == "left"
+
+    def test_navigate_rebuilds_screen_index_when_screens_are_reordered(self):
+        root, manager = _build_root_with_manager()
+        root.navigate("tomorrow")
+
+        # Same number of screens, different order: five_days now comes first
+        manager.screen_names = ["five_days", "today", "tomorrow"]
+        root.navigate("5days")
+
+        assert root._screen_index == {"five_days": 0, "today": 1, "tomorrow": 2}
+        assert manager.transition.direction == "right"
+
     def test_sync_nav_for_current_sets_active_button(self):
         root, manager = _build_root_with_manager()
 
@@ -132,3 +177,33 @@ class TestForecastRow:
         assert row.icon_source == ""
         assert row.minmax_text == ""
         assert row.dayparts_text == ""
+
+
+class TestForecastIcon:
+    def test_warm_cache_crops_every_known_icon_once(self, tmp_path):
+        texture = Mock(size=(50, 50))
+        texture.get_region.side_effect = lambda *region: region
+
+        with patch.dict(ForecastIcon._CROPPED_TEXTURE_CACHE, clear=True):
+            with patch("ui.forecast_row.CoreImage", return_value=Mock(texture=texture)) as core_image:
+                ForecastIcon.warm_cache(tmp_path)
+                ForecastIcon.warm_cache(tmp_path)
+            cache = dict(ForecastIcon._CROPPED_TEXTURE_CACHE)
+
+        assert core_image.call_count == 2 * len(ForecastIcon._ICON_BOUNDS)
+        assert texture.get_region.call_count == len(ForecastIcon._ICON_BOUNDS)
+        # 01d bounds (13, 12, 36, 35) -> x=13, y from bottom=14, 24x24 region
+        assert cache[("01d", 50, 50)] == (13, 14, 24, 24)
+
+    def test_warm_cache_skips_icons_that_fail_to_load(self, tmp_path):
+        with patch.dict(ForecastIcon._CROPPED_TEXTURE_CACHE, clear=True):
+            with patch("ui.forecast_row.CoreImage", side_effect=OSError("missing")):
+                ForecastIcon.warm_cache(tmp_path)
+
+            assert ForecastIcon._CROPPED_TEXTURE_CACHE == {}
+
+    def test_crop_texture_ignores_unknown_icons(self):
+        texture = Mock(size=(50, 50))
+
+        assert ForecastIcon._crop_texture(texture, "location") is None
+        texture.get_region.assert_not_called()
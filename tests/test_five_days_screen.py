@@ -1,15 +1,24 @@
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from kivy.metrics import dp
+import pytest
 
 from base_screen import BaseWeatherScreen
-from screens.five_days_screen import FiveDaysScreen, ROW_HEIGHT, VISIBLE_FORECAST_DAYS
+from screens.five_days_screen import (
+    CARD_VERTICAL_PADDING,
+    MIN_RV_HEIGHT,
+    ROW_HEIGHT,
+    RV_FIXED_SPACING,
+    VISIBLE_FORECAST_DAYS,
+    FiveDaysScreen,
+)
 
 
-class BindableWidget(SimpleNamespace):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+class FakeWidget:
+    __slots__ = ("bind_calls", "height")
+
+    def __init__(self, height=0):
+        self.height = height
         self.bind_calls = []
 
     def bind(self, **kwargs):
@@ -31,6 +40,12 @@ def _sample_forecast(entries_per_day=3, days=6):
     return {"list": result}
 
 
+# Built once; _process_forecast_data only reads its input.
+_FORECAST_2_DAYS = _sample_forecast(days=2)
+_FORECAST_7_DAYS = _sample_forecast(days=7)
+_REQUIRED_KEYS = frozenset({"date_text", "icon_source", "minmax_text", "dayparts_text"})
+
+
 class TestFiveDaysScreenLifecycle:
     def test_on_kv_post_calls_super_and_schedules_callbacks(self):
         screen = FiveDaysScreen()
@@ -43,9 +58,9 @@ class TestFiveDaysScreenLifecycle:
 
     def test_bind_layout_updates_binds_existing_widgets_and_updates_height(self):
         screen = FiveDaysScreen()
-        card = BindableWidget(height=500)
-        nav = BindableWidget(height=90)
-        frog = BindableWidget(height=40)
+        card = FakeWidget(height=500)
+        nav = FakeWidget(height=90)
+        frog = FakeWidget(height=40)
         screen.ids = {"card": card, "nav": nav, "frog_slot": frog}
 
         with patch.object(screen, "_update_rv_height") as update_height:
@@ -56,38 +71,97 @@ class TestFiveDaysScreenLifecycle:
         assert len(frog.bind_calls) == 1
         update_height.assert_called_once()
 
-    def test_load_forecast_data_success_uses_api_data(self):
+    def test_load_forecast_data_fetches_off_the_ui_thread(self):
+        screen = FiveDaysScreen()
+        fake_app = SimpleNamespace(current_lat=51.0, current_lon=7.0)
+
+        with (
+            patch("screens.five_days_screen.App.get_running_app", return_value=fake_app),
+            patch("screens.five_days_screen.weather_service.get_weather_threaded") as threaded,
+            patch("screens.five_days_screen.weather_service.get_weather") as get_weather,
+        ):
+            screen._load_forecast_data()
+
+        threaded.assert_called_once()
+        assert threaded.call_args.kwargs == {"lat": 51.0, "lon": 7.0}
+        get_weather.assert_not_called()
+
+    def test_load_forecast_data_success_uses_api_data(self, inline_weather_fetch):
         screen = FiveDaysScreen()
         processed = [{"date_text": "Mo, 10.02.", "icon_source": "icons/01d.png"}]
-        api_data = _sample_forecast(days=2)
         fake_app = SimpleNamespace(current_lat=51.0, current_lon=7.0)
 
-        with patch("screens.five_days_screen.App.get_running_app", return_value=fake_app):
-            with patch("screens.five_days_screen.weather_service.get_weather", return_value=api_data):
-                with patch.object(screen, "_process_forecast_data", return_value=processed):
-                    with patch.object(screen, "_load_fallback_data") as fallback:
-                        with patch("screens.five_days_screen.Clock.schedule_once") as schedule_once:
-                            screen._load_forecast_data()
+        with (
+            patch("screens.five_days_screen.App.get_running_app", return_value=fake_app),
+            patch(
+                "screens.five_days_screen.weather_service.get_weather",
+                return_value=_FORECAST_2_DAYS,
+            ),
+            patch.object(screen, "_process_forecast_data", return_value=processed),
+            patch.object(screen, "_load_fallback_data") as fallback,
+        ):
+            screen._load_forecast_data()
 
         assert screen.forecast_items == processed
         fallback.assert_not_called()
-        assert schedule_once.call_count >= 1
+        assert inline_weather_fetch.schedule_once.call_count >= 1
 
-    def test_load_forecast_data_failure_uses_fallback(self):
+    def test_load_forecast_data_failure_uses_fallback(self, inline_weather_fetch):
         screen = FiveDaysScreen()
         fake_app = SimpleNamespace(current_lat=51.0, current_lon=7.0)
 
-        with patch("screens.five_days_screen.App.get_running_app", return_value=fake_app):
-            with patch(
+        with (
+            patch("screens.five_days_screen.App.get_running_app", return_value=fake_app),
+            patch(
                 "screens.five_days_screen.weather_service.get_weather",
                 side_effect=RuntimeError("network down"),
-            ):
-                with patch.object(screen, "_load_fallback_data") as fallback:
-                    with patch("screens.five_days_screen.Clock.schedule_once"):
-                        screen._load_forecast_data()
+            ),
+            patch.object(screen, "_load_fallback_data") as fallback,
+        ):
+            screen._load_forecast_data()
 
         fallback.assert_called_once()
 
+    def test_load_forecast_data_without_running_app_uses_fallback(self):
+        screen = FiveDaysScreen()
+
+        with (
+            patch("screens.five_days_screen.App.get_running_app", return_value=None),
+            patch("screens.five_days_screen.weather_service.get_weather_threaded") as threaded,
+            patch("screens.five_days_screen.Clock.schedule_once"),
+            patch.object(screen, "_load_fallback_data") as fallback,
+        ):
+            screen._load_forecast_data()
+
+        threaded.assert_not_called()
+        fallback.assert_called_once_with()
+
+    def test_malformed_forecast_payload_uses_fallback(self):
+        screen = FiveDaysScreen()
+        malformed = {"list": [{"dt_txt": "2026-02-10 06:00:00", "main": {}, "weather": []}]}
+
+        with (
+            patch("screens.five_days_screen.Clock.schedule_once"),
+            patch.object(screen, "_load_fallback_data") as fallback,
+        ):
+            screen._on_forecast_loaded(screen._forecast_request_id, malformed)
+
+        fallback.assert_called_once_with()
+
+    def test_forecast_results_of_superseded_fetches_are_dropped(self):
+        screen = FiveDaysScreen()
+        screen._forecast_request_id = 2
+
+        with (
+            patch.object(screen, "_process_forecast_data") as process,
+            patch.object(screen, "_load_fallback_data") as fallback,
+        ):
+            screen._on_forecast_loaded(1, _FORECAST_2_DAYS)
+            screen._on_forecast_error(1, RuntimeError("late"))
+
+        process.assert_not_called()
+        fallback.assert_not_called()
+
     def test_on_forecast_items_schedules_height_update(self):
         screen = FiveDaysScreen()
         with patch("screens.five_days_screen.Clock.schedule_once") as schedule_once:
@@ -96,15 +170,24 @@ class TestFiveDaysScreenLifecycle:
 
 
 class TestFiveDaysScreenDataProcessing:
-    def test_process_forecast_data_returns_empty_list_for_empty_payload(self):
+    @pytest.mark.parametrize(
+        ("data", "expected_rows"),
+        [
+            ({"list": []}, 0),
+            ({"list": [{"main": {"temp": 280}, "weather": [{"icon": "01d"}]}]}, 0),
+            (_FORECAST_2_DAYS, 2),
+            (_FORECAST_7_DAYS, 5),
+        ],
+        ids=["empty", "no-dt_txt", "two-days", "capped"],
+    )
+    def test_process_forecast_data_row_count(self, data, expected_rows):
         screen = FiveDaysScreen()
-        assert screen._process_forecast_data({"list": []}) == []
+        assert len(screen._process_forecast_data(data)) == expected_rows
 
-    def test_process_forecast_data_limits_to_five_days(self):
+    def test_process_forecast_data_rows_have_text_fields(self):
         screen = FiveDaysScreen()
-        result = screen._process_forecast_data(_sample_forecast(days=7))
+        result = screen._process_forecast_data(_FORECAST_7_DAYS)
 
-        assert len(result) == 5
         assert all("date_text" in item for item in result)
         assert all("minmax_text" in item for item in result)
         assert all("dayparts_text" in item for item in result)
@@ -148,9 +231,8 @@ class TestFiveDaysScreenDataProcessing:
         screen._load_fallback_data()
 
         assert len(screen.forecast_items) == 5
-        required = {"date_text", "icon_source", "minmax_text", "dayparts_text"}
         for item in screen.forecast_items:
-            assert required.issubset(item.keys())
+            assert _REQUIRED_KEYS.issubset(item.keys())
             assert item["icon_source"].startswith("icons/")
 
 
@@ -170,31 +252,28 @@ class TestFiveDaysScreenLayout:
     def test_update_rv_height_uses_min_of_content_and_available(self):
         screen = FiveDaysScreen()
         screen.forecast_items = [1, 2]
-        rv = SimpleNamespace(height=0)
-        card = SimpleNamespace(height=500)
-        nav = SimpleNamespace(height=90)
-        frog_slot = SimpleNamespace(height=30)
+        rv = FakeWidget(height=0)
+        card = FakeWidget(height=500)
+        nav = FakeWidget(height=90)
+        frog_slot = FakeWidget(height=30)
         screen.ids = {"rv": rv, "card": card, "nav": nav, "frog_slot": frog_slot}
 
         screen._update_rv_height()
 
         content_height = ROW_HEIGHT * max(len(screen.forecast_items), VISIBLE_FORECAST_DAYS)
-        fixed_spacing = dp(10 * 4)
-        weather_card_vertical_padding = dp(44)
-        available = card.height - weather_card_vertical_padding - nav.height - frog_slot.height - fixed_spacing
-        if available < dp(140):
-            available = dp(140)
+        available = card.height - CARD_VERTICAL_PADDING - nav.height - frog_slot.height - RV_FIXED_SPACING
+        available = max(available, MIN_RV_HEIGHT)
         assert rv.height == min(content_height, available)
 
     def test_update_rv_height_enforces_minimum_available_height(self):
         screen = FiveDaysScreen()
         screen.forecast_items = list(range(20))
-        rv = SimpleNamespace(height=0)
-        card = SimpleNamespace(height=100)
-        nav = SimpleNamespace(height=70)
-        frog_slot = SimpleNamespace(height=30)
+        rv = FakeWidget(height=0)
+        card = FakeWidget(height=100)
+        nav = FakeWidget(height=70)
+        frog_slot = FakeWidget(height=30)
         screen.ids = {"rv": rv, "card": card, "nav": nav, "frog_slot": frog_slot}
 
         screen._update_rv_height()
 
-        assert rv.height == dp(140)
+        assert rv.height == MIN_RV_HEIGHT
@@ -4,12 +4,16 @@ from types import SimpleNamespace
 
 from app_mixins.location_cache import LocationCacheMixin
 
+_INVALID_JSON = b"{ invalid json"
+
 
 class AttrDict(dict):
     __getattr__ = dict.__getitem__
 
 
 class DummyScreen:
+    __slots__ = ("location_text",)
+
     def __init__(self):
         self.location_text = ""
 
@@ -86,7 +90,7 @@ class TestLocationCacheMixin:
         app = DummyLocationApp(tmp_path)
         app._save_last_known_location(48.5, 7.9, label="Karlsruhe, DE")
 
-        payload = json.loads((tmp_path / "last_location.json").read_text(encoding="utf-8"))
+        payload = json.loads((tmp_path / "last_location.json").read_bytes())
         assert payload["lat"] == 48.5
         assert payload["lon"] == 7.9
         assert payload["label"] == "Karlsruhe, DE"
@@ -114,7 +118,7 @@ class TestLocationCacheMixin:
 
     def test_load_last_known_location_ignores_invalid_json(self, tmp_path):
         app = DummyLocationApp(tmp_path)
-        (tmp_path / "last_location.json").write_text("{ invalid json", encoding="utf-8")
+        (tmp_path / "last_location.json").write_bytes(_INVALID_JSON)
 
         app._load_last_known_location()
 
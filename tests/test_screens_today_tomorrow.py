@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+import pytest
+
 from screens.today_screen import TodayScreen
 from screens.tomorrow_screen import TomorrowScreen
 
@@ -25,6 +27,31 @@ def _entry(hour, temp=280, icon="01d", main="Clouds"):
     }
 
 
+class TestHourlyScreens:
+    @pytest.mark.parametrize(
+        ("screen_cls", "factory_target"),
+        [
+            (TodayScreen, "screens.today_screen.Factory.HourForecast"),
+            (TomorrowScreen, "screens.tomorrow_screen.Factory.HourForecast"),
+        ],
+        ids=["today", "tomorrow"],
+    )
+    def test_set_hourly_data_uses_defaults_for_missing_fields(self, screen_cls, factory_target):
+        screen = screen_cls()
+        box = DummyBox()
+        screen.ids = {"hourly_box": box}
+
+        with patch(factory_target, side_effect=lambda **kwargs: kwargs):
+            screen.set_hourly_data([{}])
+
+        assert len(box.widgets) == 1
+        widget = box.widgets[0]
+        assert widget["time_text"] == "00:00"
+        assert widget["icon_source"] == "icons/01d.png"
+        assert widget["temp_text"].startswith("--")
+        assert widget["desc_text"] == ""
+
+
 class TestTodayScreen:
     def test_set_hourly_data_keeps_items_when_hourly_box_is_missing(self):
         screen = TodayScreen()
@@ -49,17 +76,17 @@ class TestTodayScreen:
         assert box.widgets[0]["time_text"] == "00:00"
         assert box.widgets[0]["icon_source"] == "icons/01d.png"
 
-    def test_set_hourly_data_uses_defaults_for_missing_fields(self):
+    def test_set_hourly_data_uses_defaults_for_empty_weather_and_main(self):
         screen = TodayScreen()
         box = DummyBox()
         screen.ids = {"hourly_box": box}
 
         with patch("screens.today_screen.Factory.HourForecast", side_effect=lambda **kwargs: kwargs):
-            screen.set_hourly_data([{}])
+            screen.set_hourly_data([{"dt_txt": "2026-02-10 15:00:00", "weather": [], "main": {}}])
 
         assert len(box.widgets) == 1
         widget = box.widgets[0]
-        assert widget["time_text"] == "00:00"
+        assert widget["time_text"] == "15:00"
         assert widget["icon_source"] == "icons/01d.png"
         assert widget["temp_text"].startswith("--")
         assert widget["desc_text"] == ""
@@ -100,21 +127,3 @@ class TestTomorrowScreen:
         assert box.cleared is True
         assert len(box.widgets) == 12
         assert box.widgets[0]["icon_source"] == "icons/02d.png"
-
-    def test_set_hourly_data_uses_defaults_for_missing_fields(self):
-        screen = TomorrowScreen()
-        box = DummyBox()
-        screen.ids = {"hourly_box": box}
-
-        with patch(
-            "screens.tomorrow_screen.Factory.HourForecast",
-            side_effect=lambda **kwargs: kwargs,
-        ):
-            screen.set_hourly_data([{}])
-
-        assert len(box.widgets) == 1
-        widget = box.widgets[0]
-        assert widget["time_text"] == "00:00"
-        assert widget["icon_source"] == "icons/01d.png"
-        assert widget["temp_text"].startswith("--")
-        assert widget["desc_text"] == ""
@@ -1,8 +1,13 @@
+import json
+import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import os
 
 import pytest
+import requests
 
 import services.config as config
 import services.weather_service as weather_service
@@ -25,6 +30,16 @@ class TestEnvLoading:
             "API_KEY": "abc123",
         }
 
+    def test_parse_env_text_handles_crlf_and_equals_in_values(self):
+        text = "# comment\r\nURL = https://api.example.test/forecast?units=metric \r\nAPI_KEY=abc123\r\n"
+
+        parsed = weather_service._parse_env_text(text)
+
+        assert parsed == {
+            "URL": "https://api.example.test/forecast?units=metric",
+            "API_KEY": "abc123",
+        }
+
     def test_default_env_paths_adds_android_hints_once(self):
         env_values = {"ANDROID_ARGUMENT": "/tmp/p4a", "ANDROID_PRIVATE": "/tmp/p4a"}
         with patch(
@@ -37,6 +52,14 @@ class TestEnvLoading:
         assert as_strings.count(str(Path("/tmp/p4a/.env"))) == 1
         assert as_strings.count(str(Path("/tmp/p4a/app/.env"))) == 1
 
+    def test_default_env_paths_is_computed_once(self):
+        with patch("services.weather_service.os.getenv", return_value=None) as getenv:
+            first = weather_service._default_env_paths()
+            second = weather_service._default_env_paths()
+
+        assert first is second
+        assert getenv.call_count == 2  # ANDROID_ARGUMENT + ANDROID_PRIVATE, once
+
     def test_load_dotenv_from_explicit_path_updates_environment(self, tmp_path):
         env_file = tmp_path / ".env"
         env_file.write_text(
@@ -86,15 +109,71 @@ class TestEnvLoading:
                 with pytest.raises(weather_service.EnvNotFoundError):
                     weather_service.load_dotenv()
 
+    def test_load_dotenv_default_search_runs_once(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("URL=https://api.example.test/forecast\n", encoding="utf-8")
+
+        with (
+            patch(
+                "services.weather_service._default_env_paths",
+                return_value=[env_file],
+            ) as default_paths,
+            patch.dict(os.environ, {}, clear=True),
+        ):
+            first = weather_service.load_dotenv()
+            second = weather_service.load_dotenv()
+
+        assert first == {"URL": "https://api.example.test/forecast"}
+        assert second == {}
+        default_paths.assert_called_once()
+
+    def test_load_dotenv_skip_flag_bypasses_default_search(self):
+        with (
+            patch.dict(os.environ, {"WEATHERAPP_SKIP_DOTENV": "1"}, clear=True),
+            patch("services.weather_service._default_env_paths") as default_paths,
+        ):
+            assert weather_service.load_dotenv() == {}
+
+        default_paths.assert_not_called()
+
+    def test_load_dotenv_remembers_missing_env(self):
+        with (
+            patch(
+                "services.weather_service._default_env_paths",
+                return_value=[Path("/still/missing/.env")],
+            ) as default_paths,
+            patch(
+                "services.weather_service._load_dotenv_from_android_assets",
+                return_value=None,
+            ) as load_assets,
+        ):
+            for _ in range(2):
+                with pytest.raises(weather_service.EnvNotFoundError):
+                    weather_service.load_dotenv()
+
+        default_paths.assert_called_once()
+        load_assets.assert_called_once()
+
     def test_android_asset_loader_returns_none_if_pyjnius_missing(self):
+        # A None entry in sys.modules makes "import jnius" raise ImportError.
+        with (
+            patch.dict(os.environ, {"ANDROID_ARGUMENT": "/tmp/p4a"}),
+            patch.dict(sys.modules, {"jnius": None}),
+        ):
+            assert weather_service._load_dotenv_from_android_assets() is None
+
+    def test_android_asset_loader_skips_pyjnius_off_android(self):
         real_import = __import__
 
         def fake_import(name, *args, **kwargs):
             if name == "jnius":
-                raise ImportError("pyjnius missing in tests")
+                raise AssertionError("pyjnius must not be imported off Android")
             return real_import(name, *args, **kwargs)
 
-        with patch("builtins.__import__", side_effect=fake_import):
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("builtins.__import__", side_effect=fake_import),
+        ):
             assert weather_service._load_dotenv_from_android_assets() is None
 
 
@@ -136,6 +215,42 @@ class TestConfigResolution:
         assert url == "https://config.example/api"
         assert api_key == "config-key"
 
+    def test_get_config_caches_resolved_values(self):
+        with patch.dict(
+            os.environ,
+            {"URL": "https://env.example/api", "API_KEY": "env-key"},
+            clear=True,
+        ):
+            first = weather_service._get_config()
+
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("services.weather_service.load_dotenv") as load_dotenv,
+        ):
+            second = weather_service._get_config()
+
+        assert second == first == ("https://env.example/api", "env-key")
+        load_dotenv.assert_not_called()
+
+    def test_invalidate_config_cache_forces_resolution(self):
+        with patch.dict(
+            os.environ,
+            {"URL": "https://old.example/api", "API_KEY": "old-key"},
+            clear=True,
+        ):
+            weather_service._get_config()
+
+        weather_service._invalidate_config_cache()
+        with patch.dict(
+            os.environ,
+            {"URL": "https://new.example/api", "API_KEY": "new-key"},
+            clear=True,
+        ):
+            url, api_key = weather_service._get_config()
+
+        assert url == "https://new.example/api"
+        assert api_key == "new-key"
+
     def test_get_config_raises_when_all_sources_are_missing(self):
         with patch.dict(os.environ, {}, clear=True):
             with patch(
@@ -149,18 +264,41 @@ class TestConfigResolution:
 
 
 class TestUrlAndCacheHelpers:
-    def test_build_request_url_sets_appid_and_coordinates(self):
-        built = weather_service.build_request_url(
-            "https://api.example.test/forecast?units=metric",
-            "my-api-key",
-            lat=48.5,
-            lon=7.9,
-        )
-
-        assert "appid=my-api-key" in built
-        assert "units=metric" in built
-        assert "lat=48.5" in built
-        assert "lon=7.9" in built
+    @pytest.mark.parametrize(
+        ("url", "api_key", "coords", "expected"),
+        [
+            (
+                "https://api.example.test/forecast?units=metric",
+                "my-api-key",
+                {"lat": 48.5, "lon": 7.9},
+                "https://api.example.test/forecast?units=metric&appid=my-api-key&lat=48.5&lon=7.9",
+            ),
+            (
+                "https://api.example.test/forecast?appid=old&lat=1.5&units=metric",
+                "new key",
+                {"lat": 48.5, "lon": 7.9},
+                "https://api.example.test/forecast?units=metric&appid=new+key&lat=48.5&lon=7.9",
+            ),
+            (
+                "https://api.example.test/forecast?appid=old&lat=1.5&units=metric",
+                "k",
+                {},
+                "https://api.example.test/forecast?units=metric&appid=k&lat=1.5",
+            ),
+        ],
+        ids=["sets-appid-and-coords", "overrides-existing-params", "keeps-url-coords"],
+    )
+    def test_build_request_url(self, url, api_key, coords, expected):
+        assert weather_service.build_request_url(url, api_key, **coords) == expected
+
+    def test_build_request_url_is_memoized(self):
+        args = ("https://api.example.test/forecast", "my-api-key")
+
+        first = weather_service.build_request_url(*args, lat=48.5, lon=7.9)
+        second = weather_service.build_request_url(*args, lat=48.5, lon=7.9)
+
+        assert first is second
+        assert weather_service.build_request_url.cache_info().hits == 1
 
     def test_get_weather_cache_path_points_to_expected_file(self):
         cache_path = weather_service._get_weather_cache_path()
@@ -177,6 +315,35 @@ class TestUrlAndCacheHelpers:
 
         assert loaded == payload
 
+    def test_save_weather_cache_replaces_file_atomically(self, tmp_path):
+        cache_file = tmp_path / "json" / "last_weather.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text('{"old": true}', encoding="utf-8")
+
+        with (
+            patch("services.weather_service._get_weather_cache_path", return_value=cache_file),
+            patch("services.weather_service.os.replace", wraps=os.replace) as replace,
+        ):
+            weather_service._save_weather_cache({"cod": "200"})
+
+        tmp_name, target = replace.call_args.args
+        assert Path(tmp_name).parent == cache_file.parent
+        assert target == cache_file
+        assert json.loads(cache_file.read_text(encoding="utf-8")) == {"cod": "200"}
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    def test_save_weather_cache_keeps_old_file_and_cleans_up_on_failure(self, tmp_path):
+        cache_file = tmp_path / "json" / "last_weather.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text('{"old": true}', encoding="utf-8")
+
+        # A set is not JSON serialisable, so the dump fails part-way
+        with patch("services.weather_service._get_weather_cache_path", return_value=cache_file):
+            weather_service._save_weather_cache({"list": {1}})
+
+        assert json.loads(cache_file.read_text(encoding="utf-8")) == {"old": True}
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
     def test_load_weather_cache_returns_none_when_file_is_missing(self, tmp_path):
         cache_file = tmp_path / "json" / "does-not-exist.json"
 
@@ -190,64 +357,111 @@ class TestFetchJson:
     @staticmethod
     def _response(
         status_code=200,
-        ok=True,
         payload=None,
         text="",
     ):
-        fake = Mock()
-        fake.status_code = status_code
-        fake.ok = ok
-        fake.text = text
         if payload is None:
             payload = {"cod": "200", "list": []}
-        fake.json.return_value = payload
-        return fake
+        body = text if text else json.dumps(payload)
+        return SimpleNamespace(status_code=status_code, content=body.encode("utf-8"))
+
+    @staticmethod
+    def _patch_get(**kwargs):
+        return patch.object(weather_service._get_session(), "get", **kwargs)
+
+    def test_get_session_is_shared_and_retries_transient_errors(self):
+        session = weather_service._get_session()
+
+        assert weather_service._get_session() is session
+        retries = session.get_adapter("https://api.example.test").max_retries
+        assert retries.total == 2
+        assert retries.read == 0
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert session.headers["Accept-Encoding"] == "gzip, deflate"
+        assert session.headers["User-Agent"] == "WeatherApp/1.0"
+
+    def test_fetch_json_uses_injected_session(self):
+        session = Mock()
+        session.get.return_value = self._response()
+
+        with (
+            patch("services.weather_service._get_session") as get_session,
+            patch("services.weather_service._save_weather_cache"),
+        ):
+            result = weather_service.fetch_json(
+                "https://api.example.test/forecast", timeout=3, session=session
+            )
+
+        assert result == {"cod": "200", "list": []}
+        session.get.assert_called_once_with("https://api.example.test/forecast", timeout=3)
+        get_session.assert_not_called()
+
+    def test_fetch_json_uses_separate_connect_and_read_timeouts_by_default(self):
+        with (
+            self._patch_get(return_value=self._response()) as get,
+            patch("services.weather_service._save_weather_cache"),
+        ):
+            weather_service.fetch_json("https://api.example.test/forecast")
+
+        get.assert_called_once_with(
+            "https://api.example.test/forecast",
+            timeout=(weather_service.CONNECT_TIMEOUT, weather_service.READ_TIMEOUT),
+        )
 
     def test_fetch_json_raises_network_error_on_timeout(self):
-        with patch(
-            "services.weather_service.requests.get",
-            side_effect=weather_service.requests.Timeout(),
+        with (
+            self._patch_get(side_effect=requests.Timeout()),
+            pytest.raises(weather_service.NetworkError),
+        ):
+            weather_service.fetch_json("https://api.example.test/forecast")
+
+    @pytest.mark.parametrize(
+        ("status_code", "body", "error"),
+        [
+            (401, "Unauthorized", weather_service.APITokenExpiredError),
+            (500, "Internal server error", weather_service.ServiceUnavailableError),
+            (502, "Bad gateway", weather_service.ServiceUnavailableError),
+            (503, "Service unavailable", weather_service.ServiceUnavailableError),
+            (400, "Bad request", weather_service.APIRequestError),
+            (404, "Not found", weather_service.APIRequestError),
+            (200, "<html>not json</html>", weather_service.APIRequestError),
+        ],
+        ids=["401", "500", "502", "503", "400", "404", "invalid-json"],
+    )
+    def test_fetch_json_maps_failed_responses_to_errors(self, status_code, body, error):
+        response = self._response(status_code=status_code, text=body)
+        with (
+            self._patch_get(return_value=response),
+            pytest.raises(error),
         ):
-            with pytest.raises(weather_service.NetworkError):
-                weather_service.fetch_json("https://api.example.test/forecast")
-
-    def test_fetch_json_raises_api_token_error_on_401(self):
-        response = self._response(status_code=401, ok=False, text="Unauthorized")
-        with patch("services.weather_service.requests.get", return_value=response):
-            with pytest.raises(weather_service.APITokenExpiredError):
-                weather_service.fetch_json("https://api.example.test/forecast")
-
-    def test_fetch_json_raises_service_unavailable_on_5xx(self):
-        response = self._response(status_code=503, ok=False, text="Service unavailable")
-        with patch("services.weather_service.requests.get", return_value=response):
-            with pytest.raises(weather_service.ServiceUnavailableError):
-                weather_service.fetch_json("https://api.example.test/forecast")
-
-    def test_fetch_json_raises_api_request_error_on_non_ok_4xx(self):
-        response = self._response(status_code=404, ok=False, text="Not found")
-        with patch("services.weather_service.requests.get", return_value=response):
-            with pytest.raises(weather_service.APIRequestError):
-                weather_service.fetch_json("https://api.example.test/forecast")
-
-    def test_fetch_json_raises_api_request_error_on_invalid_json(self):
-        response = self._response()
-        response.json.side_effect = ValueError("invalid json")
-        with patch("services.weather_service.requests.get", return_value=response):
-            with pytest.raises(weather_service.APIRequestError):
-                weather_service.fetch_json("https://api.example.test/forecast")
+            weather_service.fetch_json("https://api.example.test/forecast")
+
+    def test_fetch_json_error_message_includes_truncated_body(self):
+        response = self._response(status_code=404, text="x" * 2000)
+        with (
+            self._patch_get(return_value=response),
+            pytest.raises(weather_service.APIRequestError) as excinfo,
+        ):
+            weather_service.fetch_json("https://api.example.test/forecast")
+
+        assert str(excinfo.value) == f"API request failed: HTTP 404: {'x' * 512}"
 
     def test_fetch_json_raises_api_request_error_on_payload_cod_error(self):
         response = self._response(payload={"cod": "404", "message": "city not found"})
-        with patch("services.weather_service.requests.get", return_value=response):
-            with pytest.raises(weather_service.APIRequestError):
-                weather_service.fetch_json("https://api.example.test/forecast")
+        with (
+            self._patch_get(return_value=response),
+            pytest.raises(weather_service.APIRequestError),
+        ):
+            weather_service.fetch_json("https://api.example.test/forecast")
 
     def test_fetch_json_returns_payload_and_saves_cache_on_success(self):
         payload = {"cod": "200", "list": [{"main": {"temp": 295}}]}
         response = self._response(payload=payload)
-        with patch("services.weather_service.requests.get", return_value=response):
-            with patch("services.weather_service._save_weather_cache") as save_cache:
-                result = weather_service.fetch_json("https://api.example.test/forecast")
+        with (
+            self._patch_get(return_value=response),
+            patch("services.weather_service._save_weather_cache") as save_cache,
+        ):
+            result = weather_service.fetch_json("https://api.example.test/forecast")
 
         assert result == payload
         save_cache.assert_called_once_with(payload)
@@ -308,3 +522,143 @@ class TestGetWeather:
                 with patch("services.weather_service._load_weather_cache", return_value=None):
                     with pytest.raises(weather_service.APIRequestError):
                         weather_service.get_weather()
+
+    def test_get_weather_serves_repeated_calls_from_memory_within_ttl(self):
+        payload = {"cod": "200", "list": []}
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch("services.weather_service.fetch_json", return_value=payload) as fetch_json,
+            patch("services.weather_service.time.monotonic", side_effect=[100.0, 110.0, 200.0]),
+        ):
+            first = weather_service.get_weather(lat=1, lon=2)
+            second = weather_service.get_weather(lat=1, lon=2)
+            third = weather_service.get_weather(lat=1, lon=2)
+
+        assert first == second == third == payload
+        assert fetch_json.call_count == 2
+
+    def test_get_weather_memory_cache_stays_within_cap(self):
+        max_entries = weather_service._RESPONSE_CACHE_MAX
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch("services.weather_service.fetch_json", return_value={"cod": "200", "list": []}),
+        ):
+            for i in range(max_entries + 3):
+                weather_service.get_weather(lat=52.0 + i / 1000, lon=13.0)
+
+        assert len(weather_service._RESPONSE_CACHE) == max_entries
+        # The most recent fixes are kept
+        assert next(reversed(weather_service._RESPONSE_CACHE)) == (52.0 + (max_entries + 2) / 1000, 13.0)
+
+    def test_get_weather_prunes_expired_entries_on_insert(self):
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch("services.weather_service.fetch_json", return_value={"cod": "200", "list": []}),
+            patch("services.weather_service.time.monotonic", side_effect=[100.0, 200.0]),
+        ):
+            weather_service.get_weather(lat=1, lon=2)
+            weather_service.get_weather(lat=3, lon=4)
+
+        assert list(weather_service._RESPONSE_CACHE) == [(3, 4)]
+
+    def test_get_weather_memory_hits_are_isolated_from_caller_changes(self):
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch("services.weather_service.fetch_json", return_value={"cod": "200", "list": []}),
+        ):
+            first = weather_service.get_weather(lat=1, lon=2)
+            first["__cached__"] = True
+            second = weather_service.get_weather(lat=1, lon=2)
+            second["list"] = None
+            third = weather_service.get_weather(lat=1, lon=2)
+
+        assert third == {"cod": "200", "list": []}
+
+    def test_get_weather_falls_back_to_stale_memory_before_disk(self):
+        payload = {"cod": "200", "list": []}
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch(
+                "services.weather_service.fetch_json",
+                side_effect=[payload, weather_service.NetworkError("offline")],
+            ),
+            patch("services.weather_service._load_weather_cache") as load_cache,
+            patch("services.weather_service.time.monotonic", side_effect=[100.0, 200.0]),
+        ):
+            weather_service.get_weather(lat=1, lon=2)
+            result = weather_service.get_weather(lat=1, lon=2)
+
+        assert result == {**payload, "__cached__": True}
+        assert "__cached__" not in payload
+        load_cache.assert_not_called()
+
+    def test_get_weather_skips_stale_memory_for_non_network_errors(self):
+        payload = {"cod": "200", "list": []}
+        disk_payload = {"cod": "200", "list": [{"main": {"temp": 300}}]}
+        with (
+            patch(
+                "services.weather_service._get_config",
+                return_value=("https://api.example.test/forecast", "key-123"),
+            ),
+            patch(
+                "services.weather_service.fetch_json",
+                side_effect=[payload, weather_service.APITokenExpiredError("expired")],
+            ),
+            patch("services.weather_service._load_weather_cache", return_value=disk_payload),
+            patch("services.weather_service.time.monotonic", side_effect=[100.0, 200.0]),
+        ):
+            weather_service.get_weather(lat=1, lon=2)
+            result = weather_service.get_weather(lat=1, lon=2)
+
+        assert result is disk_payload
+        assert result["__cached__"] is True
+
+    def test_get_weather_threaded_reports_result_via_callback(self):
+        done, errors = [], []
+        with patch("services.weather_service.get_weather", return_value={"cod": "200"}) as get_weather:
+            thread = weather_service.get_weather_threaded(done.append, errors.append, lat=1, lon=2)
+            thread.join(timeout=5)
+
+        assert thread.daemon is True
+        assert done == [{"cod": "200"}]
+        assert errors == []
+        get_weather.assert_called_once_with(lat=1, lon=2)
+
+    def test_get_weather_threaded_reports_errors_via_callback(self):
+        done, errors = [], []
+        error = weather_service.NetworkError("offline")
+        with patch("services.weather_service.get_weather", side_effect=error):
+            thread = weather_service.get_weather_threaded(done.append, errors.append)
+            thread.join(timeout=5)
+
+        assert done == []
+        assert errors == [error]
+
+
+class TestImportCost:
+    def test_importing_service_does_not_import_requests(self):
+        code = "import sys; import services.weather_service; print('requests' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(weather_service.__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
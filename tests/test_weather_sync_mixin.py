@@ -1,5 +1,7 @@
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import DEFAULT, Mock, patch
+
+import pytest
 
 import services.weather_service as weather_service
 from app_mixins.weather_sync import WeatherSyncMixin
@@ -10,6 +12,14 @@ class AttrDict(dict):
 
 
 class DummyTodayScreen:
+    __slots__ = (
+        "condition_text",
+        "hourly_calls",
+        "location_icon_source",
+        "temp_text",
+        "weather_icon",
+    )
+
     def __init__(self):
         self.temp_text = ""
         self.condition_text = ""
@@ -22,6 +32,15 @@ class DummyTodayScreen:
 
 
 class DummyTomorrowScreen:
+    __slots__ = (
+        "condition_text",
+        "dayparts_text",
+        "hourly_calls",
+        "location_icon_source",
+        "minmax_text",
+        "weather_icon",
+    )
+
     def __init__(self):
         self.condition_text = ""
         self.minmax_text = ""
@@ -35,10 +54,12 @@ class DummyTomorrowScreen:
 
 
 class DummyFiveDaysScreen:
+    __slots__ = ("load_calls",)
+
     def __init__(self):
         self.load_calls = 0
 
-    def _load_forecast_data(self):
+    def _load_forecast_data(self, _dt=None):
         self.load_calls += 1
 
 
@@ -66,6 +87,7 @@ class DummyWeatherSyncApp(WeatherSyncMixin):
         self.current_lon = None
         self.last_location_label = None
         self._weather_from_cache = False
+        self._has_live_gps_fix = False
         self.saved_locations = []
         self.labels = []
         self.root = SimpleNamespace(ids=AttrDict(sm=DummyScreenManager()))
@@ -134,35 +156,101 @@ class TestWeatherSyncMixin:
         assert app.current_lon == 7.9
         get_weather.assert_not_called()
 
-    def test_apply_location_success_path_updates_state_and_calls_hooks(self):
+    def test_start_weather_refresh_timer_schedules_interval_once(self):
+        app = DummyWeatherSyncApp()
+
+        with patch("app_mixins.weather_sync.Clock.schedule_interval", return_value="event") as schedule_interval:
+            app._start_weather_refresh_timer()
+            app._start_weather_refresh_timer()
+
+        schedule_interval.assert_called_once_with(app._on_weather_refresh_tick, 60)
+        assert app._weather_refresh_event == "event"
+
+    def test_weather_refresh_tick_waits_for_coordinates(self):
+        app = DummyWeatherSyncApp()
+
+        with patch.object(app, "_apply_location") as apply_location:
+            app._on_weather_refresh_tick(60)
+
+        apply_location.assert_not_called()
+
+    def test_weather_refresh_tick_forces_refresh_for_current_coordinates(self):
+        app = DummyWeatherSyncApp()
+        app.current_lat = 48.5
+        app.current_lon = 7.9
+        app._has_live_gps_fix = True
+
+        with patch.object(app, "_apply_location") as apply_location:
+            app._on_weather_refresh_tick(60)
+
+        apply_location.assert_called_once_with(
+            48.5, 7.9, force_refresh=True, track_as_gps=True, save_location=False
+        )
+
+    def test_stop_weather_refresh_timer_cancels_event_and_allows_restart(self):
+        app = DummyWeatherSyncApp()
+        event = Mock()
+        app._weather_refresh_event = event
+
+        app._stop_weather_refresh_timer()
+        app._stop_weather_refresh_timer()
+
+        event.cancel.assert_called_once_with()
+        assert app._weather_refresh_event is None
+
+    def test_apply_location_refresh_does_not_rewrite_location_cache(self, inline_weather_fetch):
         app = DummyWeatherSyncApp()
         payload = _sample_weather_payload()
 
-        with patch("app_mixins.weather_sync.weather_service.get_weather", return_value=payload):
-            with patch.object(app, "_log_location_roundtrip") as log_roundtrip:
-                with patch.object(
-                    app, "_update_location_labels_from_weather", return_value="Berlin, DE"
-                ) as update_labels:
-                    with patch.object(app, "_update_weather_display") as update_display:
-                        with patch.object(app, "_refresh_forecast_screen") as refresh_forecast:
-                            app._apply_location(
-                                48.5,
-                                7.9,
-                                force_refresh=True,
-                                track_as_gps=True,
-                            )
+        with (
+            patch("app_mixins.weather_sync.weather_service.get_weather", return_value=payload),
+            patch.object(app, "_update_weather_display"),
+            patch.object(app, "_refresh_forecast_screen"),
+        ):
+            app._apply_location(48.5, 7.9, force_refresh=True, track_as_gps=True, save_location=False)
+
+        assert app.saved_locations == []
+        assert app.current_lat == 48.5
+
+    def test_apply_location_forced_refresh_restarts_throttle_window(self, inline_weather_fetch):
+        app = DummyWeatherSyncApp()
+
+        with (
+            patch("app_mixins.weather_sync.time.monotonic", return_value=500.0),
+            patch("app_mixins.weather_sync.weather_service.get_weather", side_effect=RuntimeError("offline")),
+        ):
+            app._apply_location(48.5, 7.9, force_refresh=True, track_as_gps=False)
+
+        assert app._last_weather_refresh_ts == 500.0
+
+    def test_apply_location_success_path_updates_state_and_calls_hooks(self, inline_weather_fetch):
+        app = DummyWeatherSyncApp()
+        payload = _sample_weather_payload()
+        update_labels = Mock(return_value="Berlin, DE")
+
+        with (
+            patch("app_mixins.weather_sync.weather_service.get_weather", return_value=payload),
+            patch.multiple(
+                app,
+                _log_location_roundtrip=DEFAULT,
+                _update_location_labels_from_weather=update_labels,
+                _update_weather_display=DEFAULT,
+                _refresh_forecast_screen=DEFAULT,
+            ) as hooks,
+        ):
+            app._apply_location(48.5, 7.9, force_refresh=True, track_as_gps=True)
 
         assert app.current_lat == 48.5
         assert app.current_lon == 7.9
         assert app.saved_locations[0] == (48.5, 7.9, None)
         assert app.saved_locations[1] == (48.5, 7.9, "Berlin, DE")
         assert app._weather_from_cache is False
-        log_roundtrip.assert_called_once()
+        hooks["_log_location_roundtrip"].assert_called_once()
         update_labels.assert_called_once()
-        update_display.assert_called_once()
-        refresh_forecast.assert_called_once()
+        hooks["_update_weather_display"].assert_called_once()
+        hooks["_refresh_forecast_screen"].assert_called_once()
 
-    def test_apply_location_error_uses_last_location_label_when_available(self):
+    def test_apply_location_error_uses_last_location_label_when_available(self, inline_weather_fetch):
         app = DummyWeatherSyncApp()
         app.last_location_label = "Hamburg, DE"
 
@@ -175,7 +263,7 @@ class TestWeatherSyncMixin:
         assert app._weather_from_cache is True
         assert app.labels[-1] == "Hamburg, DE"
 
-    def test_apply_location_error_uses_generated_error_label_when_no_last_label(self):
+    def test_apply_location_error_uses_generated_error_label_when_no_last_label(self, inline_weather_fetch):
         app = DummyWeatherSyncApp()
         app.last_location_label = None
 
@@ -188,9 +276,33 @@ class TestWeatherSyncMixin:
         assert app._weather_from_cache is True
         assert "API Key ungueltig" in app.labels[-1]
 
-    def test_location_label_from_error_variants(self):
+    def test_apply_location_fetches_off_the_ui_thread(self):
         app = DummyWeatherSyncApp()
-        cases = [
+
+        with (
+            patch("app_mixins.weather_sync.weather_service.get_weather_threaded") as threaded,
+            patch("app_mixins.weather_sync.weather_service.get_weather") as get_weather,
+        ):
+            app._apply_location(48.5, 7.9, force_refresh=True)
+
+        threaded.assert_called_once()
+        assert threaded.call_args.kwargs == {"lat": 48.5, "lon": 7.9}
+        get_weather.assert_not_called()
+
+    def test_stale_weather_results_are_dropped(self):
+        app = DummyWeatherSyncApp()
+        app._weather_request_id = 2
+
+        with patch.object(app, "_update_weather_display") as update_display:
+            app._on_weather_loaded(1, 48.5, 7.9, False, _sample_weather_payload())
+        app._on_weather_error(1, False, RuntimeError("late"))
+
+        update_display.assert_not_called()
+        assert app.labels == []
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
             (weather_service.EnvNotFoundError("x"), ".env fehlt"),
             (weather_service.MissingAPIConfigError("x"), "API Konfig fehlt"),
             (weather_service.APITokenExpiredError("x"), "API Key ungueltig"),
@@ -198,11 +310,15 @@ class TestWeatherSyncMixin:
             (weather_service.ServiceUnavailableError("x"), "Wetterdienst down"),
             (weather_service.APIRequestError("x"), "API Anfragefehler"),
             (RuntimeError("x"), "Standort nicht verfuegbar"),
-        ]
-
-        for error, expected in cases:
-            assert expected in app._location_label_from_error(error, track_as_gps=False)
+        ],
+        ids=lambda value: type(value).__name__ if isinstance(value, Exception) else None,
+    )
+    def test_location_label_from_error_variants(self, error, expected):
+        app = DummyWeatherSyncApp()
+        assert expected in app._location_label_from_error(error, track_as_gps=False)
 
+    def test_location_label_from_error_mentions_gps_when_tracking(self):
+        app = DummyWeatherSyncApp()
         assert "GPS erkannt" in app._location_label_from_error(RuntimeError("x"), track_as_gps=True)
 
     def test_extract_location_label_from_city_object_and_top_level_fallback(self):
@@ -249,7 +365,7 @@ class TestWeatherSyncMixin:
         ) as schedule_once:
             app._refresh_forecast_screen()
 
-        schedule_once.assert_called_once()
+        schedule_once.assert_called_once_with(five_days_screen._load_forecast_data, 0)
         assert five_days_screen.load_calls == 1
 
     def test_refresh_forecast_screen_returns_early_without_root(self):